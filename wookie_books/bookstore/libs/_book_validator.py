@@ -0,0 +1,72 @@
+# Generated by "python manage.py compile_schemas" from BOOK_SCHEMA. Do not edit.
+VERSION = "2.16.3"
+import re
+from fastjsonschema import JsonSchemaValueException
+
+
+REGEX_PATTERNS = {
+    'date-time_re_pattern': re.compile('^\\d{4}-[01]\\d-[0-3]\\d(t|T)[0-2]\\d:[0-5]\\d:[0-5]\\d(?:\\.\\d+)?(?:[+-][0-2]\\d:[0-5]\\d|[+-][0-2]\\d[0-5]\\d|z|Z)\\Z')
+}
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'properties': {'title': {'type': 'string', 'maxLength': 255}, 'description': {'type': 'string'}, 'author': {'type': 'object', 'properties': {'id': {'type': 'integer'}}}, 'cover_image': {'type': 'string'}, 'price': {'type': 'string'}, 'published_on': {'type': 'string', 'format': 'date-time'}, 'published': {'type': 'boolean'}}, 'required': ['title', 'description', 'price']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not all(prop in data for prop in ['title', 'description', 'price']):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain ['title', 'description', 'price'] properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'properties': {'title': {'type': 'string', 'maxLength': 255}, 'description': {'type': 'string'}, 'author': {'type': 'object', 'properties': {'id': {'type': 'integer'}}}, 'cover_image': {'type': 'string'}, 'price': {'type': 'string'}, 'published_on': {'type': 'string', 'format': 'date-time'}, 'published': {'type': 'boolean'}}, 'required': ['title', 'description', 'price']}, rule='required')
+        data_keys = set(data.keys())
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'maxLength': 255}, rule='type')
+            if isinstance(data__title, str):
+                data__title_len = len(data__title)
+                if data__title_len > 255:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be shorter than or equal to 255 characters", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'maxLength': 255}, rule='maxLength')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string'}, rule='type')
+        if "author" in data_keys:
+            data_keys.remove("author")
+            data__author = data["author"]
+            if not isinstance(data__author, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".author must be object", value=data__author, name="" + (name_prefix or "data") + ".author", definition={'type': 'object', 'properties': {'id': {'type': 'integer'}}}, rule='type')
+            data__author_is_dict = isinstance(data__author, dict)
+            if data__author_is_dict:
+                data__author_keys = set(data__author.keys())
+                if "id" in data__author_keys:
+                    data__author_keys.remove("id")
+                    data__author__id = data__author["id"]
+                    if not isinstance(data__author__id, (int)) and not (isinstance(data__author__id, float) and data__author__id.is_integer()) or isinstance(data__author__id, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".author.id must be integer", value=data__author__id, name="" + (name_prefix or "data") + ".author.id", definition={'type': 'integer'}, rule='type')
+        if "cover_image" in data_keys:
+            data_keys.remove("cover_image")
+            data__coverimage = data["cover_image"]
+            if not isinstance(data__coverimage, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".cover_image must be string", value=data__coverimage, name="" + (name_prefix or "data") + ".cover_image", definition={'type': 'string'}, rule='type')
+        if "price" in data_keys:
+            data_keys.remove("price")
+            data__price = data["price"]
+            if not isinstance(data__price, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".price must be string", value=data__price, name="" + (name_prefix or "data") + ".price", definition={'type': 'string'}, rule='type')
+        if "published_on" in data_keys:
+            data_keys.remove("published_on")
+            data__publishedon = data["published_on"]
+            if not isinstance(data__publishedon, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".published_on must be string", value=data__publishedon, name="" + (name_prefix or "data") + ".published_on", definition={'type': 'string', 'format': 'date-time'}, rule='type')
+            if isinstance(data__publishedon, str):
+                if not REGEX_PATTERNS["date-time_re_pattern"].match(data__publishedon):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".published_on must be date-time", value=data__publishedon, name="" + (name_prefix or "data") + ".published_on", definition={'type': 'string', 'format': 'date-time'}, rule='format')
+        if "published" in data_keys:
+            data_keys.remove("published")
+            data__published = data["published"]
+            if not isinstance(data__published, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".published must be boolean", value=data__published, name="" + (name_prefix or "data") + ".published", definition={'type': 'boolean'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,28 @@
+import time
+
+from django.core.cache import cache
+
+# how long a rendered public book list is served from the cache, in seconds
+BOOK_LIST_CACHE_TIMEOUT = 60
+
+_VERSION_KEY = 'books:version'
+
+
+def book_list_key_prefix():
+    """
+    Returns the cache key prefix for book list responses. It embeds a version number that
+    invalidate_book_lists() bumps, so writes make every cached list unreachable at once.
+    """
+    # seed from the clock, an evicted version key must not bring back older cached lists
+    version = cache.get_or_set(_VERSION_KEY, time.time_ns(), None)
+    return f'books:{version}'
+
+
+def invalidate_book_lists():
+    """
+    Invalidates every cached book list response.
+    """
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.set(_VERSION_KEY, time.time_ns(), None)
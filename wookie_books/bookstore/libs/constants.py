@@ -1,14 +1,19 @@
 BLOCK_USER = "darth vader"
 
 CODE = {
-    "1001": "{} is not allowed to publish books on Wookie Books.",
+    "1001": lambda username: f"{username} is not allowed to publish books on Wookie Books.",
     "1002": "Book already exists for the user.",
     "1003": "Book created successfully!",
     "1004": "Unpublished successfully!",
     "1005": "Darth Vader is not allowed to publish books.",
-    "1006": "Invalid key: {}, needs to match {}"
+    "1006": lambda path, schema: f"Invalid key: {path}, needs to match {schema}",
+    "1007": "The book must be a JSON object."
 }
 
+# Keep BOOK_SCHEMA as plain dicts and lists: jsonschema checks it against the draft-07
+# meta-schema and fastjsonschema only accepts dict definitions, so neither works with a
+# MappingProxyType or tuple. The compiled validator inlines the schema, so mutating this
+# dict after compilation does not change validation.
 BOOK_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "type": "object",
@@ -23,3 +28,12 @@ BOOK_SCHEMA = {
     },
     "required": ["title", "description", "price"]
 }
+
+
+def format_code(code, *args):
+    """
+    Returns the message for the given code. Messages that take arguments are
+    stored as callables, plain messages are returned as they are.
+    """
+    message = CODE[code]
+    return message(*args) if callable(message) else message
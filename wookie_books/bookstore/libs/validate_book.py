@@ -1,22 +1,93 @@
+from functools import reduce
+from operator import or_
+from threading import Lock
+
+from cachetools import TTLCache
+from django.db.models import Count, Q
+
 from bookstore.models import Book
 from .constants import BLOCK_USER
 from .constants import BOOK_SCHEMA
-import jsonschema
+import fastjsonschema
+from ._book_validator import validate as _validate_book
+
+_REQUIRED = frozenset(BOOK_SCHEMA["required"])
+
+# (author_id, title) of books known to exist. Titles are kept as submitted: the database decides
+# which spellings are the same title, Python's case mapping does not always agree with it.
+_EXISTS = TTLCache(maxsize=4096, ttl=5)
+_EXISTS_LOCK = Lock()
+
+
+def clear_cache():
+    """Forgets every cached existence check."""
+    with _EXISTS_LOCK:
+        _EXISTS.clear()
+
+
+def forget_author(author_id):
+    """
+    Forgets the cached existence checks of the author's books. All of the author's
+    entries are dropped because a save may have renamed the book.
+    """
+    with _EXISTS_LOCK:
+        for key in [key for key in _EXISTS if key[0] == author_id]:
+            _EXISTS.pop(key, None)
+
+
+def _book_exists(author_id, title):
+    """
+    Returns whether the author already has a book with the given title, compared
+    case-insensitively. Titles found are kept for a few seconds so repeated submissions
+    of the same book do not hit the database every time. A missing title is not cached,
+    a book added without signals (bulk_create, another process) must not be reported
+    as free.
+    """
+    key = (author_id, title)
+    with _EXISTS_LOCK:
+        if key in _EXISTS:
+            return True
+    exists = Book.objects.filter(title__iexact=title, author_id=author_id).exists()
+    if exists:
+        with _EXISTS_LOCK:
+            _EXISTS[key] = True
+    return exists
 
 
-class ValidateBook:
+def _check_schema(data):
     """
-    The ValidateBook class contains a method to validate whether a book title can be added
-    by a specific author based on certain conditions.
+    Validates data against BOOK_SCHEMA. Returns None when the data is valid, otherwise
+    the "1006" result with the offending key path and schema keyword.
+    """
+    # a missing field is the most common failure, report it without running the full validator
+    if isinstance(data, dict) and not _REQUIRED.issubset(data):
+        return "1006", False, ",".join(sorted(_REQUIRED.difference(data))), "required"
+
+    try:
+        _validate_book(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        # e.path starts with the root name ("data"), skip it to keep the key path only
+        p = e.path
+        path = p[1] if len(p) == 2 else ",".join(p[1:])
+        return "1006", False, path, e.rule
+    return None
+
+
+def _is_blocked(author):
+    return author.username.casefold() == BLOCK_USER
+
+
+def validate(author, title, data):
+    """
+    Validates whether a book can be added by a specific author.
 
     Args:
     author: An instance of CustomUser representing the author who wants to add a book.
+    title: The title of the book to be added.
+    data: The book payload to validate against the schema.
 
-    Methods:
-    validate(title): This method takes in a title parameter which is the title of the book to be added.
-    validate(data): This method takes data parameter to validate the schema.
-    It checks data with the schema, if a book with different data type which not match with the schema, the same title,
-    and author already exists and returns appropriate code and status.
+    It checks data with the schema, if a book with different data type which not match with the schema, the same title
+    (compared case-insensitively), and author already exists and returns appropriate code and status.
 
     Returns:
     Returns four values, code and status, j_path, j_schema, where:
@@ -24,24 +95,56 @@ class ValidateBook:
     status: A boolean indicating whether the book title can be added or not.
     True means the title is valid, False means the title is invalid.
     j_path: A key path of the json.
-    j_schema: type of the schema.
+    j_schema: the schema keyword the data failed, e.g. 'type' or 'maxLength'.
     """
+    if _is_blocked(author):
+        return "1005", False, None, None
 
-    def __init__(self, author):
-        self.author = author
+    error = _check_schema(data)
+    if error is not None:
+        return error
 
-    def validate(self, title, data):
-        try:
-            jsonschema.validate(data, BOOK_SCHEMA)
-        except jsonschema.exceptions.ValidationError as e:
-            path = ",".join(e.path)
-            return "1006", False, path, e.schema
+    if _book_exists(author.pk, title):
+        return "1002", False, None, None
+
+    return "1003", True, None, None
+
+
+def validate_many(author, items):
+    """
+    Validates a list of book payloads for the author the same way as validate(), looking up
+    existing titles with a single query. A title repeated within the list is reported as
+    already existing from its second occurrence on.
+
+    Returns:
+    A list with one (code, status, j_path, j_schema) tuple per item, in order.
+    """
+    if _is_blocked(author):
+        return [("1005", False, None, None)] * len(items)
 
-        if self.author.username.lower() == BLOCK_USER:
-            return "1005", False, None, None
-        book = Book.objects.filter(title=title, author=self.author)
+    results = [_check_schema(item) for item in items]
+    titles = list(dict.fromkeys(item["title"] for item, result in zip(items, results) if result is None))
 
-        if book.exists():
-            return "1002", False, None, None
+    existing = set()
+    if titles:
+        # compare with title__iexact like validate(), the database decides what "same title" means;
+        # one count per candidate title, all in a single query
+        counts = (
+            Book.objects.filter(author_id=author.pk)
+            .filter(reduce(or_, (Q(title__iexact=title) for title in titles)))
+            .aggregate(**{str(i): Count('pk', filter=Q(title__iexact=title)) for i, title in enumerate(titles)})
+        )
+        existing = {titles[int(i)] for i, count in counts.items() if count}
 
-        return "1003", True, None, None
+    accepted = set()
+    for i, item in enumerate(items):
+        if results[i] is not None:
+            continue
+        title = item["title"]
+        # a title repeated later in the same batch is a duplicate of this one
+        if title in existing or title.upper() in accepted:
+            results[i] = ("1002", False, None, None)
+        else:
+            accepted.add(title.upper())
+            results[i] = ("1003", True, None, None)
+    return results
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import fastjsonschema
+from django.core.management.base import BaseCommand, CommandError
+
+from bookstore.libs.constants import BOOK_SCHEMA
+
+BOOK_VALIDATOR_PATH = Path(__file__).resolve().parents[2] / 'libs' / '_book_validator.py'
+HEADER = '# Generated by "python manage.py compile_schemas" from BOOK_SCHEMA. Do not edit.\n'
+
+
+class Command(BaseCommand):
+    """
+    Generates bookstore/libs/_book_validator.py from BOOK_SCHEMA with fastjsonschema, so
+    workers import a plain Python validator instead of compiling the schema at startup.
+
+    Run it again whenever BOOK_SCHEMA changes. With --check the command only verifies that
+    the generated module is up to date and fails otherwise.
+    """
+    help = "Generates the book validator module from BOOK_SCHEMA."
+    # the system checks import the URLconf, which imports the generated module
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Fail if the generated module is out of date instead of writing it."
+        )
+
+    def handle(self, *args, **options):
+        code = HEADER + fastjsonschema.compile_to_code(BOOK_SCHEMA)
+        if options['check']:
+            if not BOOK_VALIDATOR_PATH.exists() or BOOK_VALIDATOR_PATH.read_text() != code:
+                raise CommandError(
+                    f"{BOOK_VALIDATOR_PATH.name} is out of date, run 'python manage.py compile_schemas'."
+                )
+            return
+
+        BOOK_VALIDATOR_PATH.write_text(code)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {BOOK_VALIDATOR_PATH}"))
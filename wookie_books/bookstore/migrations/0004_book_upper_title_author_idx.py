@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-15 21:13
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0003_book_author_title_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(django.db.models.functions.text.Upper('title'), models.F('author'), name='book_upper_title_author_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Cast, Round
+
+
+def price_to_cents(apps, schema_editor):
+    Book = apps.get_model('bookstore', 'Book')
+    Book.objects.update(price_cents=Cast(Round(models.F('price') * 100), models.PositiveIntegerField()))
+
+
+def cents_to_price(apps, schema_editor):
+    Book = apps.get_model('bookstore', 'Book')
+    Book.objects.update(price=models.F('price_cents') * Decimal('0.01'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0004_book_upper_title_author_idx'),
+    ]
+
+    operations = [
+        # nullable until 0006 drops it, so rolling 0006 back can re-add the column before
+        # cents_to_price fills it
+        migrations.AlterField(
+            model_name='book',
+            name='price',
+            field=models.DecimalField(decimal_places=2, help_text='The price of the book', max_digits=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='price_cents',
+            field=models.PositiveIntegerField(default=0, help_text='The price of the book in cents'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(price_to_cents, cents_to_price),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0005_book_price_cents'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='book',
+            name='price',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-15 21:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0006_remove_book_price'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='published_on',
+            field=models.DateTimeField(auto_now_add=True, help_text='The date and time the book was published'),
+        ),
+    ]
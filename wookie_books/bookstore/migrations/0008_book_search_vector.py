@@ -0,0 +1,57 @@
+# Generated by Django 4.1.7 on 2026-10-15 21:22
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='book_search_vector_idx')
+
+
+def create_search_index(apps, schema_editor):
+    # tsvector search and GIN indexes only exist on PostgreSQL, other databases keep using SearchFilter
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Book = apps.get_model('bookstore', 'Book')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.execute(
+        f"UPDATE {Book._meta.db_table} AS b SET search_vector = "
+        f"setweight(to_tsvector('english', b.title), 'A') || "
+        f"setweight(to_tsvector('english', b.description), 'B') || "
+        f"setweight(to_tsvector('english', u.author_pseudonym), 'C') "
+        f"FROM {User._meta.db_table} AS u WHERE u.id = b.author_id"
+    )
+    schema_editor.add_index(Book, SEARCH_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('bookstore', 'Book'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('bookstore', '0007_alter_book_published_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document of the title, description and author', null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='book',
+                    index=SEARCH_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
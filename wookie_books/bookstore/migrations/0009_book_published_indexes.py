@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-15 21:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0008_book_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(condition=models.Q(('published', True)), fields=['id'], name='book_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author', 'published'], name='book_author_published_idx'),
+        ),
+    ]
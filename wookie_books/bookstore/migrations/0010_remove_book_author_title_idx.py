@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-15 21:44
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookstore', '0009_book_published_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='book',
+            name='book_author_title_idx',
+        ),
+    ]
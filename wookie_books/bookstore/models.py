@@ -1,5 +1,31 @@
-from django.db import models
-from users.models import CustomUser
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models.functions import Upper
+
+from .libs.book_cache import invalidate_book_lists
+
+
+class BookQuerySet(models.QuerySet):
+    """
+    BookQuerySet adds bulk operations to Book querysets.
+
+    Methods:
+        unpublish(self) -> int:
+            Unpublishes every book in the queryset with a single UPDATE and returns the number of
+            books matched. No model signals are sent; the cached book lists are invalidated here,
+            once the transaction commits. search_vector is not refreshed, which is fine as
+            'published' is not part of it; see bookstore.signals for other bulk writes.
+    """
+
+    def unpublish(self):
+        updated = self.update(published=False)
+        if updated:
+            transaction.on_commit(invalidate_book_lists, using=self.db)
+        return updated
 
 
 class Book(models.Model):
@@ -12,30 +38,49 @@ class Book(models.Model):
         description (models.TextField): A description of the book.
         author (models.ForeignKey): A foreign key reference to the CustomUser model as the author of the book.
         cover_image (models.ImageField): An optional image of the book's cover.
-        price (models.DecimalField): The price of the book.
+        price_cents (models.PositiveIntegerField): The price of the book in cents.
+        price (Decimal): The price of the book, read from and written to price_cents.
         published_on (models.DateTimeField): The date and time the book was published.
         published (models.BooleanField): A flag indicating whether the book is published.
+        search_vector (SearchVectorField): The full-text search document built from the title, description
+            and author pseudonym, maintained on PostgreSQL only (see bookstore.signals).
 
     Methods:
         __str__(self) -> str:
             Returns a string representation of the book instance, using the title.
 
         unpublish(self) -> None:
-            Sets the 'published' attribute to False, effectively unpublishing the book.
+            Sets the 'published' attribute to False and stores it, effectively unpublishing the book.
 
-    The Book model enforces uniqueness on the combination of 'title' and 'author' fields.
+    The Book model enforces uniqueness on the combination of 'title' and 'author' fields,
+    and indexes (UPPER('title'), 'author') for case-insensitive title lookups, published
+    books for the public views and ('author', 'published') for an author's published or
+    unpublished books. On PostgreSQL search_vector is backed by a GIN index.
     """
     title = models.CharField(max_length=255, help_text="The title of the book")
     description = models.TextField(help_text="A description of the book")
-    author = models.ForeignKey(CustomUser, on_delete=models.CASCADE, help_text="Author of written work")
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, help_text="Author of written work")
     cover_image = models.ImageField(upload_to='covers/', null=True, blank=True,
                                     help_text="An optional image of the book's cover")
-    price = models.DecimalField(max_digits=7, decimal_places=2, help_text="The price of the book")
-    published_on = models.DateTimeField(auto_now=True, help_text="The date and time the book was published")
+    price_cents = models.PositiveIntegerField(help_text="The price of the book in cents")
+    published_on = models.DateTimeField(auto_now_add=True, help_text="The date and time the book was published")
     published = models.BooleanField(default=True, help_text="A flag indicating whether the book is published")
+    search_vector = SearchVectorField(null=True, editable=False,
+                                      help_text="Full-text search document of the title, description and author")
+
+    objects = BookQuerySet.as_manager()
 
     class Meta:
         unique_together = ('title', 'author')
+        indexes = [
+            # matches the UPPER(title) predicate Django emits for title__iexact
+            models.Index(Upper('title'), 'author', name='book_upper_title_author_idx'),
+            # partial index over published books only, for the public list and detail views
+            models.Index(fields=['id'], name='book_pub_idx', condition=models.Q(published=True)),
+            models.Index(fields=['author', 'published'], name='book_author_published_idx'),
+            # only created on PostgreSQL, see migration 0008
+            GinIndex(fields=['search_vector'], name='book_search_vector_idx'),
+        ]
 
     def __str__(self):
         """
@@ -46,11 +91,34 @@ class Book(models.Model):
         """
         return self.title
 
+    @property
+    def price(self):
+        """
+        Returns the price of the book as a Decimal with two decimal places.
+
+        Returns:
+            Decimal: The price derived from price_cents, or None if no price is set.
+        """
+        if self.price_cents is None:
+            return None
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.setter
+    def price(self, value):
+        """
+        Stores the given price (Decimal, str, int or float) as whole cents.
+        """
+        self.price_cents = int((Decimal(str(value)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
     def unpublish(self):
         """
         Sets the 'published' attribute to False, effectively unpublishing the book.
 
+        The change is written with BookQuerySet.unpublish(), a single UPDATE of the 'published'
+        column, so callers don't need to save the instance afterwards.
+
         Returns:
             None
         """
+        type(self).objects.filter(pk=self.pk).unpublish()
         self.published = False
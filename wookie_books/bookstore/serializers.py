@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
 from .models import Book
@@ -15,8 +17,18 @@ class BookSerializer(serializers.ModelSerializer):
         serializers.ModelSerializer: A base class for model serializers in Django REST framework.
 
     Attributes:
+        price (serializers.DecimalField): The price of the book, stored on the model as price_cents.
         Meta (class): A nested class that provides metadata options for the serializer.
+
+    Methods:
+        update(self, instance, validated_data) -> Book:
+            Updates the book, writing only the columns present in validated_data.
+        get_list_queryset(cls) -> QuerySet:
+            Returns a Book queryset limited to the serialized columns.
     """
+    price = serializers.DecimalField(max_digits=7, decimal_places=2, min_value=Decimal('0'),
+                                     help_text="The price of the book")
+
     class Meta:
         """
        Meta is a nested class that defines metadata options for the BookSerializer.
@@ -27,3 +39,87 @@ class BookSerializer(serializers.ModelSerializer):
        """
         model = Book
         fields = ('id', 'title', 'description', 'cover_image', 'price')
+
+    def update(self, instance, validated_data):
+        """
+        Updates the book with the validated data and saves only the columns that changed,
+        so a PATCH of the title doesn't rewrite the description or the cover image.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=['price_cents' if attr == 'price' else attr for attr in validated_data])
+        return instance
+
+    @classmethod
+    def get_list_queryset(cls):
+        """
+        Returns a Book queryset that reads only the columns this serializer renders,
+        plus the author_id used by the views' ownership filters, so listing views
+        avoid loading unused columns.
+        """
+        return Book.objects.only(
+            'id', 'title', 'description', 'cover_image', 'price_cents', 'author'
+        )
+
+
+def _cover_image_url(name, request):
+    """
+    Returns the URL of a stored cover image, absolute when a request is available.
+    """
+    if not name:
+        return None
+    url = Book._meta.get_field('cover_image').storage.url(name)
+    if request is not None:
+        url = request.build_absolute_uri(url)
+    return url
+
+
+def _format_price(price_cents):
+    return f"{price_cents // 100}.{price_cents % 100:02d}"
+
+
+class FastBookSerializer(serializers.Serializer):
+    """
+    FastBookSerializer is a read-only serializer for Book instances, used by the detail
+    endpoint and the authenticated user's book lists.
+
+    It renders the same fields as BookSerializer ('id', 'title', 'description',
+    'cover_image' and 'price') by building the dictionary directly from the instance,
+    skipping the per-field dispatch of ModelSerializer. Writes go through BookSerializer.
+
+    Inherits from:
+        serializers.Serializer: A base class for serializers in Django REST framework.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'description': instance.description,
+            'cover_image': _cover_image_url(instance.cover_image.name, self.context.get('request')),
+            'price': _format_price(instance.price_cents),
+        }
+
+
+class BookListSerializer(serializers.Serializer):
+    """
+    BookListSerializer is a read-only serializer for the public book list. It renders the
+    dictionaries of Book.objects.values(*BookListSerializer.VALUES), so list rows are never
+    turned into Book instances, with the same output as FastBookSerializer.
+
+    Inherits from:
+        serializers.Serializer: A base class for serializers in Django REST framework.
+
+    Attributes:
+        VALUES (tuple): The Book columns the serializer reads.
+    """
+    VALUES = ('id', 'title', 'description', 'cover_image', 'price_cents')
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'description': row['description'],
+            'cover_image': _cover_image_url(row['cover_image'], self.context.get('request')),
+            'price': _format_price(row['price_cents']),
+        }
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, transaction
+from django.db.models import Value
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .libs import validate_book
+from .libs.book_cache import invalidate_book_lists
+from .models import Book
+
+SEARCH_CONFIG = 'english'
+
+
+def book_search_vector(author_pseudonym):
+    """
+    Returns the expression Book.search_vector is computed from: the title ranks above the
+    description, which ranks above the author's pseudonym.
+    """
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+        + SearchVector(Value(author_pseudonym), weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def _is_postgres(using):
+    return connections[using].vendor == 'postgresql'
+
+
+# search_vector is kept up to date from post_save only. Book.objects.bulk_create() and queryset
+# update() send no signals: books written that way keep a stale (or NULL) search_vector until
+# their next save(). BookQuerySet.unpublish() only writes 'published', which is not indexed.
+@receiver(post_save, sender=Book)
+def _update_book_search_vector(sender, instance, using, update_fields=None, **kwargs):
+    if not _is_postgres(using):
+        return
+    if update_fields is not None and not {'title', 'description'}.intersection(update_fields):
+        return
+    Book.objects.using(using).filter(pk=instance.pk).update(
+        search_vector=book_search_vector(instance.author.author_pseudonym)
+    )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def _update_author_search_vectors(sender, instance, using, created=False, update_fields=None, **kwargs):
+    # a new author has no books yet, and logins only touch last_login
+    if created or not _is_postgres(using):
+        return
+    if update_fields is not None and 'author_pseudonym' not in update_fields:
+        return
+    Book.objects.using(using).filter(author=instance).update(
+        search_vector=book_search_vector(instance.author_pseudonym)
+    )
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def _invalidate_book_lists(sender, using, **kwargs):
+    # a request reading before the commit would cache the old list under the new version
+    transaction.on_commit(invalidate_book_lists, using=using)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def _forget_author_books(sender, instance, **kwargs):
+    validate_book.forget_author(instance.author_id)
@@ -1,26 +1,61 @@
+import json
 from decimal import Decimal
 from io import BytesIO
+from unittest import mock, skipUnless
 
 import jsonschema
 from PIL import Image
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
-from django.urls import reverse
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Value
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 from rest_framework.test import APIRequestFactory
 
+from users.models import CustomUser
+from . import signals
 from .libs import constants
-from .models import CustomUser, Book
-from .serializers import BookSerializer
+from .libs import validate_book
+from .models import Book
+from .serializers import BookListSerializer, BookSerializer, FastBookSerializer
+
+
+def _make_jpeg():
+    """Encodes a 1x1 JPEG once, the serializer only needs a valid image, not its pixels."""
+    buffer = BytesIO()
+    Image.new('RGB', (1, 1), color='red').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+_JPEG_BYTES = _make_jpeg()
+
+
+def _cover():
+    """Returns a fresh cover upload, an uploaded file is consumed once it has been saved."""
+    return SimpleUploadedFile("test_cover.jpg", _JPEG_BYTES, content_type="image/jpeg")
+
+
+BOOK_LIST_URL = reverse_lazy('book_list_create')
+MY_BOOKS_URL = reverse_lazy('my_book_detail')
+UNPUBLISHED_BOOKS_URL = reverse_lazy('list_unpublished_books')
 
 mock_book_schema = constants.BOOK_SCHEMA
+_BOOK_VALIDATOR = jsonschema.Draft7Validator(mock_book_schema)
+
+P_999 = Decimal('9.99')
+P_1099 = Decimal('10.99')
+P_1299 = Decimal('12.99')
+P_1599 = Decimal('15.99')
 
 mock_create_book = {
     "title": "Test Book",
     "description": "This is a test book.",
-    "cover_image": SimpleUploadedFile("test_cover.jpg", b"file_content", content_type="image/jpeg"),
     "price": "9.99",
     "published": True
 }
@@ -32,36 +67,46 @@ mock_create_user = {
 }
 
 
+class _BookFixtureMixin:
+    """
+    Creates the test user and one book of theirs once per test class. Classes that need more
+    data override setUpTestData and call super() first; set with_cover to give the book a cover.
+    """
+
+    with_cover = False
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = CustomUser.objects.create_user(**mock_create_user)
+        cls.book = Book.objects.create(
+            title=mock_create_book.get("title"),
+            description=mock_create_book.get("description"),
+            author=cls.user,
+            cover_image=_cover() if cls.with_cover else None,
+            price=P_999,
+            published=mock_create_book.get("published")
+        )
+
+
 # model
-class BookTestCase(TestCase):
+class BookTestCase(_BookFixtureMixin, TestCase):
     """
     BookTestCase contains test cases for the Book model.
 
     Test cases:
         - test_book_created: Verifies that a book is created successfully with the correct attributes.
+        - test_book_price_stored_in_cents: Checks that the price is stored in cents and read back as a Decimal.
         - test_book_str_representation: Tests the string representation of a book using its title.
-        - test_book_unpublish: Ensures the unpublish method sets the 'published' attribute to False.
+        - test_book_unpublish: Ensures the unpublish method sets and stores the 'published' attribute as False.
+        - test_book_queryset_unpublish: Checks that BookQuerySet.unpublish unpublishes all matching books at once.
         - test_unique_together_constraint: Checks that the unique_together constraint is enforced
                                            for the combination of 'title' and 'author' fields.
 
-    The setUp method creates a CustomUser and a Book instance to be used in the test cases.
+    _BookFixtureMixin creates the CustomUser and the Book instance, with a cover, used in the test cases.
     """
 
-    def setUp(self):
-        self.user = CustomUser.objects.create_user(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password"),
-            author_pseudonym=mock_create_user.get("author_pseudonym")
-        )
-
-        self.book = Book.objects.create(
-            title=mock_create_book.get("title"),
-            description=mock_create_book.get("description"),
-            author=self.user,
-            cover_image=mock_create_book.get("cover_image"),
-            price=mock_create_book.get("price"),
-            published=mock_create_book.get("published")
-        )
+    with_cover = True
 
     def test_book_created(self):
         """Test that the book is created successfully."""
@@ -72,39 +117,92 @@ class BookTestCase(TestCase):
         self.assertEqual(str(self.book.price), "9.99")
         self.assertTrue(self.book.published)
 
+    def test_book_price_stored_in_cents(self):
+        """Test that the price is stored as whole cents and read back as a Decimal."""
+        self.assertEqual(self.book.price_cents, 999)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.price, P_999)
+
     def test_book_str_representation(self):
         """Test the string representation of the book."""
         self.assertEqual(str(self.book), mock_create_book.get("title"))
 
     def test_book_unpublish(self):
-        """Test that the unpublish method sets the published attribute to False."""
+        """Test that the unpublish method sets the published attribute to False and stores it."""
         self.book.unpublish()
         self.assertFalse(self.book.published)
+        self.book.refresh_from_db()
+        self.assertFalse(self.book.published)
+
+    def test_book_queryset_unpublish(self):
+        """Test that BookQuerySet.unpublish unpublishes every matching book in one query."""
+        Book.objects.create(title="Another Test Book", description="This is another test book.",
+                            author=self.user, price=P_1299)
+        with self.assertNumQueries(1):
+            self.assertEqual(Book.objects.filter(author=self.user).unpublish(), 2)
+        self.assertFalse(Book.objects.filter(published=True).exists())
 
     def test_unique_together_constraint(self):
         """Test that the unique_together constraint is enforced for title and author."""
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             Book.objects.create(
                 title=mock_create_book.get("title"),
                 description="This is another test book.",
                 author=self.user,
-                price="12.99",
+                price=P_1299,
                 published=mock_create_book.get("published")
             )
 
 
-class BookSerializerTestCase(TestCase):
+class BookSearchVectorTestCase(_BookFixtureMixin, TestCase):
+    """
+    BookSearchVectorTestCase tests when the post_save receiver refreshes Book.search_vector. The
+    vector itself needs PostgreSQL, so the vendor check and the expression are patched.
+
+    Test cases:
+        - test_search_vector_skipped_on_other_databases: Checks that no extra query runs off PostgreSQL.
+        - test_search_vector_skipped_for_unindexed_fields: Checks that saving columns outside the
+                                                           vector does not refresh it.
+        - test_search_vector_updated: Checks that saving the title or description refreshes it.
+    """
+
+    def test_search_vector_skipped_on_other_databases(self):
+        with self.assertNumQueries(1):
+            self.book.save()
+
+    @mock.patch.object(signals, '_is_postgres', return_value=True)
+    def test_search_vector_skipped_for_unindexed_fields(self, _):
+        with self.assertNumQueries(1):
+            self.book.save(update_fields=['price_cents', 'published'])
+
+    @mock.patch.object(signals, 'book_search_vector', return_value=Value(None))
+    @mock.patch.object(signals, '_is_postgres', return_value=True)
+    def test_search_vector_updated(self, _, book_search_vector):
+        for update_fields in [None, ['title'], ['description', 'price_cents']]:
+            with self.subTest(update_fields=update_fields), CaptureQueriesContext(connection) as queries:
+                self.book.save(update_fields=update_fields)
+            self.assertIn('"search_vector"', queries.captured_queries[-1]['sql'])
+            book_search_vector.assert_called_with(self.user.author_pseudonym)
+
+
+class BookSerializerTestCase(_BookFixtureMixin, TestCase):
     """
     Test cases for the BookSerializer class.
 
     Methods
     -------
     setUp():
-        Sets up the test environment by creating a user and a book instance.
+        Sets up the request factory and the serializer for the book instance.
 
     test_book_serializer_serialization():
         Tests the serialization of a Book model instance using the BookSerializer.
 
+    test_fast_book_serializer_data():
+        Tests that FastBookSerializer renders the same data as BookSerializer.
+
+    test_book_list_serializer_data():
+        Tests that BookListSerializer renders the same data from values() rows as BookSerializer.
+
     test_book_serializer_deserialization():
         Tests the deserialization of data using the BookSerializer to create a Book model instance.
 
@@ -113,23 +211,10 @@ class BookSerializerTestCase(TestCase):
     None
     """
 
+    with_cover = True
+
     def setUp(self):
         self.factory = APIRequestFactory()
-        self.user = CustomUser.objects.create_user(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password"),
-            author_pseudonym=mock_create_user.get("author_pseudonym")
-        )
-
-        self.book = Book.objects.create(
-            title=mock_create_book.get("title"),
-            description=mock_create_book.get("description"),
-            author=self.user,
-            cover_image=mock_create_book.get("cover_image"),
-            price=mock_create_book.get("price"),
-            published=mock_create_book.get("published")
-        )
-
         self.serializer = BookSerializer(instance=self.book)
 
     def test_book_serializer_data(self):
@@ -143,17 +228,33 @@ class BookSerializerTestCase(TestCase):
         }
         self.assertDictEqual(self.serializer.data, expected_data)
 
+    def test_fast_book_serializer_data(self):
+        """Test that FastBookSerializer renders the same data as BookSerializer."""
+        self.assertDictEqual(FastBookSerializer(instance=self.book).data, self.serializer.data)
+
+        request = self.factory.get('/')
+        self.assertDictEqual(
+            FastBookSerializer(instance=self.book, context={'request': request}).data,
+            BookSerializer(instance=self.book, context={'request': request}).data
+        )
+
+    def test_book_list_serializer_data(self):
+        """Test that BookListSerializer renders values() rows like BookSerializer renders the book."""
+        row = Book.objects.values(*BookListSerializer.VALUES).get(pk=self.book.pk)
+        self.assertDictEqual(BookListSerializer(instance=row).data, self.serializer.data)
+
+        request = self.factory.get('/')
+        self.assertDictEqual(
+            BookListSerializer(instance=row, context={'request': request}).data,
+            BookSerializer(instance=self.book, context={'request': request}).data
+        )
+
     def test_book_serializer_deserialization(self):
         """Test deserialization of data with the BookSerializer."""
-        image = Image.new('RGB', (100, 100), color='red')
-        img_byte_arr = BytesIO()
-        image.save(img_byte_arr, format='JPEG')
-        img_byte_arr = img_byte_arr.getvalue()
-
         data = {
             'title': 'New Test Book',
             'description': 'This is a new test book.',
-            'cover_image': SimpleUploadedFile("new_test_cover.jpg", img_byte_arr, content_type="image/jpeg"),
+            'cover_image': SimpleUploadedFile("new_test_cover.jpg", _JPEG_BYTES, content_type="image/jpeg"),
             'price': '12.99',
             'author': self.user.id
         }
@@ -165,7 +266,7 @@ class BookSerializerTestCase(TestCase):
         self.assertEqual(new_book.price, Decimal(data['price']))
 
 
-class BookListCreateViewTestCase(APITestCase):
+class BookListCreateViewTestCase(_BookFixtureMixin, APITestCase):
     """
     BookListCreateViewTestCase is a test case class for testing the BookListCreateView API view.
     The purpose of this test case is to ensure that the view works as expected, and the following
@@ -184,33 +285,102 @@ class BookListCreateViewTestCase(APITestCase):
     None
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = BOOK_LIST_URL
+
     def setUp(self):
         self.client = APIClient()
-        self.user = CustomUser.objects.create_user(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password"),
-            author_pseudonym=mock_create_user.get("author_pseudonym")
-        )
-        self.book = Book.objects.create(
-            title=mock_create_book.get("title"),
-            description=mock_create_book.get("description"),
-            author=self.user,
-            price=9.99
-        )
-        self.url = reverse('book_list_create')
 
     def test_list_books(self):
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
     def test_search_books(self):
-        response = self.client.get(self.url, {'search': 'Test'})
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'search': 'Test'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_list_books_streamed(self):
+        Book.objects.create(title="Streamed Test Book", description="This is a streamed test book.",
+                            author=self.user, price=P_1299)
+        for params in [{}, {'search': 'streamed'}, {'search': 'non_existent_book'}]:
+            with self.subTest(**params):
+                response = self.client.get(self.url, dict(params, stream='1'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertTrue(response.streaming)
+                streamed = json.loads(b''.join(response.streaming_content))
+                self.assertEqual(streamed, json.loads(self.client.get(self.url, params).content))
+
+    @skipUnless(connection.vendor == 'postgresql', "full-text search needs PostgreSQL")
+    def test_search_books_full_text(self):
+        response = self.client.get(self.url, {'search': mock_create_user.get("author_pseudonym")})
+        self.assertEqual([book['title'] for book in response.data], [self.book.title])
+
+        response = self.client.get(self.url, {'search': 'tests books'})
+        self.assertEqual([book['title'] for book in response.data], [self.book.title])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class BookListCacheTestCase(_BookFixtureMixin, APITestCase):
+    """
+    BookListCacheTestCase tests that BookListCreateView responses are cached and that
+    writing a book invalidates them.
 
-class BookDetailViewTestCase(APITestCase):
+    Test cases:
+        - test_list_books_cached: Checks that a repeated request is served without queries.
+        - test_list_books_not_cached_by_clients: Checks that fresh and cached responses tell
+                                                 clients not to cache the list.
+        - test_list_books_invalidated_on_write: Checks that creating or unpublishing a book
+                                                invalidates the cached list on commit.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = BOOK_LIST_URL
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_list_books_cached(self):
+        response = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.url)
+        self.assertEqual(cached_response.data, response.data)
+
+    def test_list_books_not_cached_by_clients(self):
+        for _ in range(2):
+            response = self.client.get(self.url)
+            self.assertIn('max-age=0', response['Cache-Control'])
+            self.assertIn('no-store', response['Cache-Control'])
+        self.assertEqual(self.client.get(self.url, {'stream': '1'})['Cache-Control'], response['Cache-Control'])
+
+    def test_list_books_invalidated_on_write(self):
+        self.client.get(self.url)
+        # the lists are invalidated once the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            book = Book.objects.create(
+                title="Cached Test Book",
+                description="This is a cached test book.",
+                author=self.user,
+                price=P_999
+            )
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            book.unpublish()
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 1)
+
+
+class BookDetailViewTestCase(_BookFixtureMixin, APITestCase):
     """
     BookDetailViewTestCase is a test case class for testing the BookDetailView API view.
     The purpose of this test case is to ensure that the view works as expected, and the
@@ -229,20 +399,13 @@ class BookDetailViewTestCase(APITestCase):
     None
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('book_detail', kwargs={'pk': cls.book.pk})
+
     def setUp(self):
         self.client = APIClient()
-        self.user = CustomUser.objects.create_user(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password"),
-            author_pseudonym=mock_create_user.get("author_pseudonym")
-        )
-        self.book = Book.objects.create(
-            title=mock_create_book.get("title"),
-            description=mock_create_book.get("description"),
-            author=self.user,
-            price=9.99
-        )
-        self.url = reverse('book_detail', kwargs={'pk': self.book.pk})
 
     def test_get_book_detail(self):
         response = self.client.get(self.url)
@@ -269,37 +432,55 @@ class ListCreateBooksViewTestCase(APITestCase):
     None
     """
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username=mock_create_user.get("username"),
             password=mock_create_user.get("password"),
             author_pseudonym=mock_create_user.get("author_pseudonym")
         )
 
-        self.book1 = Book.objects.create(
-            title="Test Book 1",
-            description="This is a test book 1.",
-            author=self.user,
-            price=10.99,
-            published=mock_create_book.get("published")
-        )
-
-        self.book2 = Book.objects.create(
-            title="Test Book 2",
-            description="This is a test book 2.",
-            author=self.user,
-            price=15.99,
-            published=mock_create_book.get("published")
-        )
-        self.url = reverse('my_book_detail')
+        cls.book1, cls.book2 = Book.objects.bulk_create([
+            Book(
+                title="Test Book 1",
+                description="This is a test book 1.",
+                author=cls.user,
+                price=P_1099,
+                published=mock_create_book.get("published")
+            ),
+            Book(
+                title="Test Book 2",
+                description="This is a test book 2.",
+                author=cls.user,
+                price=P_1599,
+                published=mock_create_book.get("published")
+            ),
+        ])
+
+        # enough books that a per-book query would show up in test_list_user_books
+        Book.objects.bulk_create([
+            Book(
+                title=f"Test Book {i}",
+                description=f"This is a test book {i}.",
+                author=cls.user,
+                price=P_999,
+                published=mock_create_book.get("published")
+            )
+            for i in range(3, 21)
+        ])
+        cls.url = MY_BOOKS_URL
 
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
+        validate_book.clear_cache()
+        self.addCleanup(validate_book.clear_cache)
 
     def test_list_user_books(self):
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data), 20)
 
     def test_create_book(self):
         data = {
@@ -308,9 +489,85 @@ class ListCreateBooksViewTestCase(APITestCase):
             'price': 12.99,
         }
         response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['status_code'], status.HTTP_201_CREATED)
         self.assertEqual(response.data['message'], 'Book created successfully!')
 
+    def test_create_book_resubmitted(self):
+        data = {
+            'title': 'Resubmitted Book',
+            'description': 'New book description',
+            'price': 12.99,
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['message'], constants.format_code("1003"))
+
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['message'], constants.format_code("1002"))
+
+    def test_create_book_duplicate_title_case_insensitive(self):
+        data = {
+            'title': 'TEST BOOK 1',
+            'description': 'New book description',
+            'price': 12.99,
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['status_code'], status.HTTP_200_OK)
+        self.assertEqual(response.data['message'], constants.format_code("1002"))
+
+    def test_create_book_invalid_schema(self):
+        data = {
+            'title': 'x' * 256,
+            'description': 'New book description',
+            'price': 12.99,
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['status_code'], 422)
+        self.assertEqual(response.data['message'], constants.format_code("1006", 'title', 'maxLength'))
+
+    def test_create_book_negative_price(self):
+        data = {
+            'title': 'Negative Price Book',
+            'description': 'New book description',
+            'price': '-1.00',
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('price', response.data)
+        self.assertFalse(Book.objects.filter(title=data['title']).exists())
+
+    def test_create_book_not_an_object(self):
+        for data in [[mock_create_book], "Test Book", None]:
+            with self.subTest(data=data):
+                response = self.client.post(self.url, json.dumps(data), content_type='application/json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['message'], constants.format_code("1007"))
+        self.assertFalse(Book.objects.filter(title=mock_create_book['title']).exists())
+
+    def test_create_book_missing_required(self):
+        data = {
+            'title': 'New Book',
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['status_code'], 422)
+        self.assertEqual(response.data['message'], constants.format_code("1006", 'description,price', 'required'))
+
+    def test_create_book_blocked_user(self):
+        blocked_user = get_user_model().objects.create_user(
+            username='Darth Vader',
+            password='darthpassword',
+            author_pseudonym='darthpseudonym'
+        )
+        self.client.force_authenticate(user=blocked_user)
+        data = {
+            'title': 'x' * 256,
+            'description': 'New book description',
+            'price': 12.99,
+        }
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.data['status_code'], status.HTTP_200_OK)
+        self.assertEqual(response.data['message'], constants.format_code("1005"))
+
 
 class ListCreateBooksViewSearchTestCase(APITestCase):
     """
@@ -327,60 +584,48 @@ class ListCreateBooksViewSearchTestCase(APITestCase):
     None
     """
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username=mock_create_user.get("username"),
             password=mock_create_user.get("password"),
             author_pseudonym=mock_create_user.get("author_pseudonym")
         )
 
-        self.book1 = Book.objects.create(
-            title="Test Book 1",
-            description="This is a test book 1.",
-            author=self.user,
-            price=10.99,
-            published=mock_create_book.get("published")
-        )
-
-        self.book2 = Book.objects.create(
-            title="Test Book 2",
-            description="This is a test book 2.",
-            author=self.user,
-            price=15.99,
-            published=mock_create_book.get("published")
-        )
+        cls.book1, cls.book2 = Book.objects.bulk_create([
+            Book(
+                title="Test Book 1",
+                description="This is a test book 1.",
+                author=cls.user,
+                price=P_1099,
+                published=mock_create_book.get("published")
+            ),
+            Book(
+                title="Test Book 2",
+                description="This is a test book 2.",
+                author=cls.user,
+                price=P_1599,
+                published=mock_create_book.get("published")
+            ),
+        ])
+        cls.url = reverse('my_book_search', kwargs={'pk': cls.user.id})
 
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
-    def test_search_books_description(self):
-        self.client.login(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password")
-        )
-
-        url = reverse('my_book_search', kwargs={'pk': self.user.id})
-        response = self.client.get(url, {'search': 'test book 1'})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'Test Book 1')
-        self.assertEqual(response.data[0]['description'], 'This is a test book 1.')
-
-    def test_search_books_no_results(self):
-        self.client.login(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password")
-        )
-
-        url = reverse('my_book_search', kwargs={'pk': self.user.id})
-        response = self.client.get(url, {'search': 'non_existent_book'})
+    def test_search_books(self):
+        for search, expected_titles in [('test book 1', ['Test Book 1']), ('non_existent_book', [])]:
+            with self.subTest(search=search):
+                response = self.client.get(self.url, {'search': search})
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual([book['title'] for book in response.data], expected_titles)
+                if expected_titles:
+                    self.assertEqual(response.data[0]['description'], 'This is a test book 1.')
 
 
-class UpdateBookViewTestCase(APITestCase):
+class UpdateBookViewTestCase(_BookFixtureMixin, APITestCase):
     """
     UpdateBookViewTestCase is a test case class for testing the UpdateBookView API view.
     The purpose of this test case is to ensure that the book update functionality works
@@ -395,19 +640,12 @@ class UpdateBookViewTestCase(APITestCase):
     None
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('my_books_update', args=[cls.book.id])
+
     def setUp(self):
-        self.user = get_user_model().objects.create_user(
-            username=mock_create_user.get("username"),
-            password=mock_create_user.get("password"),
-            author_pseudonym=mock_create_user.get("author_pseudonym")
-        )
-        self.book = Book.objects.create(
-            title=mock_create_book.get("title"),
-            description=mock_create_book.get("description"),
-            author=self.user,
-            price=9.99
-        )
-        self.url = reverse('my_books_update', args=[self.book.id])
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
@@ -423,19 +661,24 @@ class UpdateBookViewTestCase(APITestCase):
         self.book.refresh_from_db()
         self.assertEqual(self.book.title, 'Updated Test Book')
         self.assertEqual(self.book.description, 'Updated test book description')
-        self.assertEqual(float(self.book.price), 12.99)
+        self.assertEqual(self.book.price, P_1299)
 
     def test_partial_update_book(self):
+        published_on = self.book.published_on
         partial_update_data = {
             'title': 'Partial Update Test Book'
         }
-        response = self.client.patch(self.url, data=partial_update_data)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, data=partial_update_data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        update_sql = next(query['sql'] for query in queries if query['sql'].startswith('UPDATE'))
+        self.assertNotIn('"description"', update_sql)
 
         self.book.refresh_from_db()
+        self.assertEqual(self.book.published_on, published_on)
         self.assertEqual(self.book.title, 'Partial Update Test Book')
         self.assertEqual(self.book.description, mock_create_book.get("description"))
-        self.assertEqual(float(self.book.price), 9.99)
+        self.assertEqual(self.book.price, P_999)
 
 
 class UnpublishedBookViewTestCase(APITestCase):
@@ -452,36 +695,52 @@ class UnpublishedBookViewTestCase(APITestCase):
     None
     """
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username='Darth Vader',
             password='darthpassword',
             author_pseudonym='darthpseudonym'
         )
-        self.published_book = Book.objects.create(
-            title='Darth Vader publish Test Book',
-            description='Published test book description',
-            author=self.user,
-            price=9.99
-        )
-        self.unpublished_book = Book.objects.create(
-            title='Darth Vader unpublish Test Book',
-            description='Unpublished test book description',
-            author=self.user,
-            price=12.99,
-            published=mock_create_book.get("published")
-        )
-        self.url = reverse('unpublished', args=[self.unpublished_book.id])
+        cls.published_book, cls.unpublished_book = Book.objects.bulk_create([
+            Book(
+                title='Darth Vader publish Test Book',
+                description='Published test book description',
+                author=cls.user,
+                price=P_999
+            ),
+            Book(
+                title='Darth Vader unpublish Test Book',
+                description='Unpublished test book description',
+                author=cls.user,
+                price=P_1299,
+                published=mock_create_book.get("published")
+            ),
+        ])
+        cls.url = reverse('unpublished', args=[cls.unpublished_book.id])
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_unpublish_book(self):
-        response = self.client.delete(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.delete(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         self.unpublished_book.refresh_from_db()
         self.assertFalse(self.unpublished_book.published)
 
+    def test_unpublish_other_users_book(self):
+        other_user = get_user_model().objects.create_user(**mock_create_user)
+        self.client.force_authenticate(user=other_user)
+
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.unpublished_book.refresh_from_db()
+        self.assertTrue(self.unpublished_book.published)
+
     def test_unpublish_already_unpublished_book(self):
         # Unpublish the book before running the test
         self.unpublished_book.unpublish()
@@ -508,34 +767,50 @@ class UnPublishedBookDetailsViewTestCase(APITestCase):
     None
     """
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username=mock_create_user.get("username"),
             password=mock_create_user.get("password"),
             author_pseudonym=mock_create_user.get("author_pseudonym")
         )
-        self.published_book = Book.objects.create(
-            title='Published Test Book',
-            description='Published test book description',
-            author=self.user,
-            price=9.99
-        )
-        self.unpublished_book = Book.objects.create(
-            title='Unpublished Test Book',
-            description='Unpublished test book description',
-            author=self.user,
-            price=12.99,
-            published=False
-        )
-        self.url = reverse('list_unpublished_books')
+        cls.published_book, cls.unpublished_book, *_ = Book.objects.bulk_create([
+            Book(
+                title='Published Test Book',
+                description='Published test book description',
+                author=cls.user,
+                price=P_999
+            ),
+            Book(
+                title='Unpublished Test Book',
+                description='Unpublished test book description',
+                author=cls.user,
+                price=P_1299,
+                published=False
+            ),
+        ] + [
+            Book(
+                title=f'Unpublished Test Book {i}',
+                description='Unpublished test book description',
+                author=cls.user,
+                price=P_1299,
+                published=False
+            )
+            for i in range(2, 21)
+        ])
+        cls.url = UNPUBLISHED_BOOKS_URL
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_get_unpublished_books(self):
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], self.unpublished_book.title)
+        self.assertEqual(len(response.data), 20)
+        self.assertIn(self.unpublished_book.title, [book['title'] for book in response.data])
+        self.assertNotIn(self.published_book.title, [book['title'] for book in response.data])
 
     def test_get_unpublished_books_unauthenticated(self):
         self.client.logout()
@@ -543,6 +818,68 @@ class UnPublishedBookDetailsViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class ValidateBookTestCase(_BookFixtureMixin, TestCase):
+    """
+    ValidateBookTestCase contains test cases for the book validation functions.
+
+    Test cases:
+        - test_validate_many: Checks that a batch of books is validated with a single query and
+                              that duplicates, both existing and within the batch, are reported.
+        - test_validate_many_non_ascii_duplicate: Checks that validate_many() reports a non-ASCII
+                                                  duplicate title like validate() does.
+        - test_validate_many_blocked_user: Checks that every book of a blocked author is rejected.
+        - test_validate_missing_title_not_cached: Checks that a book added without signals is
+                                                  reported as existing on the next validation.
+        - test_validate_cache_dropped_on_delete: Checks that deleting a book drops its cached
+                                                 existence check.
+    """
+
+    def setUp(self):
+        validate_book.clear_cache()
+        self.addCleanup(validate_book.clear_cache)
+
+    def test_validate_missing_title_not_cached(self):
+        data = {"title": "Bulk Book", "description": "Bulk", "price": "9.99"}
+        self.assertEqual(validate_book.validate(self.user, "Bulk Book", data)[0], "1003")
+        Book.objects.bulk_create([Book(title="Bulk Book", description="Bulk", author=self.user, price=P_999)])
+        self.assertEqual(validate_book.validate(self.user, "Bulk Book", data)[0], "1002")
+        with self.assertNumQueries(0):
+            self.assertEqual(validate_book.validate(self.user, "Bulk Book", data)[0], "1002")
+
+    def test_validate_cache_dropped_on_delete(self):
+        data = {"title": self.book.title, "description": "Again", "price": "9.99"}
+        self.assertEqual(validate_book.validate(self.user, self.book.title, data)[0], "1002")
+        self.book.delete()
+        self.assertEqual(validate_book.validate(self.user, self.book.title, data)[0], "1003")
+
+    def test_validate_many(self):
+        items = [
+            {"title": mock_create_book.get("title").upper(), "description": "Existing", "price": "9.99"},
+            {"title": "New Book", "description": "New", "price": "9.99"},
+            {"title": "new book", "description": "Repeated", "price": "9.99"},
+            {"title": "Missing Price", "description": "Invalid"},
+        ]
+        with self.assertNumQueries(1):
+            results = validate_book.validate_many(self.user, items)
+        self.assertEqual([result[0] for result in results], ["1002", "1003", "1002", "1006"])
+        self.assertEqual(results[3], ("1006", False, "price", "required"))
+
+    def test_validate_many_non_ascii_duplicate(self):
+        Book.objects.create(title="éclair", description="Existing", author=self.user, price=P_999)
+        item = {"title": "éCLAIR", "description": "Duplicate", "price": "9.99"}
+        self.assertEqual(validate_book.validate(self.user, item["title"], item)[0], "1002")
+        self.assertEqual(validate_book.validate_many(self.user, [item]), [("1002", False, None, None)])
+
+    def test_validate_many_blocked_user(self):
+        blocked_user = CustomUser.objects.create_user(
+            username='Darth Vader',
+            password='darthpassword',
+            author_pseudonym='darthpseudonym'
+        )
+        items = [{"title": "New Book", "description": "New", "price": "9.99"}]
+        self.assertEqual(validate_book.validate_many(blocked_user, items), [("1005", False, None, None)])
+
+
 class BookSchemaValidationTestCase(TestCase):
     """
     Test case for validating the Book schema.
@@ -562,13 +899,19 @@ class BookSchemaValidationTestCase(TestCase):
             "published": True
         }
 
+    def test_generated_validator_is_up_to_date(self):
+        """
+        Tests if the generated book validator module matches the current schema.
+        """
+        call_command('compile_schemas', check=True)
+
     def test_book_valid_schema(self):
         """
         Tests if the Book data dictionary is valid according to the schema.
         """
         self.book_dict['price'] = str(self.book_dict['price'])
         try:
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
         except jsonschema.exceptions.ValidationError as e:
             self.fail(e)
 
@@ -580,13 +923,13 @@ class BookSchemaValidationTestCase(TestCase):
             title=mock_create_book.get("title"),
             description=mock_create_book.get("description"),
             author_id=1,
-            price=9.99
+            price=P_999
         )
         self.book_dict = {
             "title": self.book.title
         }
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
 
     def test_description_schema(self):
         """
@@ -596,34 +939,29 @@ class BookSchemaValidationTestCase(TestCase):
             title=mock_create_book.get("title"),
             description=mock_create_book.get("description"),
             author_id=1,
-            price=9.99
+            price=P_999
         )
         self.book_dict = {
             "description": self.book.description
         }
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
 
     def test_author_schema(self):
         """
         Tests if the Book author field validation works properly.
         """
-        self.author = CustomUser.objects.create_user(
-            username="test_author",
-            password="testpassword",
-            author_pseudonym="Test Author"
-        )
         self.book = Book(
             title=mock_create_book.get("title"),
             description=mock_create_book.get("description"),
-            author=self.author,
-            price=9.99
+            author_id=1,
+            price=P_999
         )
         self.book_dict = {
-            "author": self.book.author.id
+            "author": self.book.author_id
         }
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
 
     def test_cover_image_schema(self):
         """
@@ -633,13 +971,13 @@ class BookSchemaValidationTestCase(TestCase):
             title=mock_create_book.get("title"),
             description=mock_create_book.get("description"),
             author_id=1,
-            price=9.99
+            price=P_999
         )
         self.book_dict = {
             "cover_image": "invalid-image-data"
         }
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
 
     def test_price_schema(self):
         """
@@ -649,10 +987,10 @@ class BookSchemaValidationTestCase(TestCase):
             title=mock_create_book.get("title"),
             description=mock_create_book.get("descritpion"),
             author_id=1,
-            price=9.99
+            price=P_999
         )
         self.book_dict = {
             "price": str(self.book.price)
         }
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(self.book_dict, mock_book_schema)
+            _BOOK_VALIDATOR.validate(self.book_dict)
@@ -1,32 +1,83 @@
+import orjson
+from django.http import Http404, StreamingHttpResponse
+from django.utils.cache import add_never_cache_headers
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from rest_framework import generics, permissions, filters
 from rest_framework.response import Response
 
+from .filters import BookSearchFilter
 from .libs import constants
-from .libs.validate_book import ValidateBook
+from .libs.book_cache import BOOK_LIST_CACHE_TIMEOUT, book_list_key_prefix
+from .libs import validate_book
 from .models import Book
-from .serializers import BookSerializer
+from .serializers import BookListSerializer, BookSerializer, FastBookSerializer
+
+# rows fetched per round trip when streaming a book list
+STREAM_CHUNK_SIZE = 2000
+
+
+def _json_array(items):
+    """
+    Yields the items encoded as a JSON array, one element at a time.
+    """
+    separator = b'['
+    for item in items:
+        yield separator + orjson.dumps(item)
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
 
 
 class BookListCreateView(generics.ListAPIView):
     """
     Provides a list of published books and allows searching by title, description or author pseudonym.
+    On PostgreSQL the search runs against the book's full-text search vector, best matches first.
+    Responses are cached per URL for BOOK_LIST_CACHE_TIMEOUT seconds, until a book is written.
+    The cache is server-side only, clients are told not to cache the list.
 
     Parameters
     ----------
     search : str, optional
         Search query for filtering books by title, description or author pseudonym.
+    stream : str, optional
+        With stream=1 the list is streamed as a JSON array while it is read from the database,
+        instead of being built in memory first. Streamed responses are not cached.
 
     Returns
     -------
     List of books : List[Book]
         Returns a list of published books matching the search query.
     """
-    queryset = Book.objects.filter(published=True)
-    serializer_class = BookSerializer
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['title', 'description', 'author__author_pseudonym', 'published']
+    queryset = Book.objects.filter(published=True).values(*BookListSerializer.VALUES)
+    serializer_class = BookListSerializer
+    filter_backends = [BookSearchFilter]
+    search_fields = ['title', 'description', 'author__author_pseudonym']
     permission_classes = [permissions.AllowAny]
 
+    def dispatch(self, request, *args, **kwargs):
+        # the key prefix changes on every book write, so the decorator is built per request
+        view = cache_page(BOOK_LIST_CACHE_TIMEOUT, key_prefix=book_list_key_prefix())(
+            vary_on_headers('Accept', 'Authorization')(super().dispatch)
+        )
+        response = view(request, *args, **kwargs)
+        # only the server-side copy is invalidated on writes, keep browsers and proxies from reusing
+        # the max-age cache_page sets; cache_page decides on rendering, and a private response isn't
+        # stored, so the headers are added once it has
+        if hasattr(response, 'add_post_render_callback'):
+            response.add_post_render_callback(add_never_cache_headers)
+        else:
+            add_never_cache_headers(response)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') != '1':
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        books = (serializer.to_representation(row) for row in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE))
+        return StreamingHttpResponse(_json_array(books), content_type='application/json')
+
 
 class BookDetailView(generics.RetrieveAPIView):
     """
@@ -42,8 +93,8 @@ class BookDetailView(generics.RetrieveAPIView):
     Book
         Returns the details of the requested book.
     """
-    queryset = Book.objects.filter(published=True)
-    serializer_class = BookSerializer
+    queryset = BookSerializer.get_list_queryset().filter(published=True)
+    serializer_class = FastBookSerializer
     permission_classes = [permissions.AllowAny]
 
 
@@ -67,29 +118,42 @@ class ListCreateBooksView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Book.objects.filter(author=self.request.user, published=True)
+        return BookSerializer.get_list_queryset().filter(author=self.request.user, published=True)
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return FastBookSerializer
+        return BookSerializer
 
     def create(self, request, *args, **kwargs):
         user = self.request.user
-        title = self.request.POST['title']
-        data = self.request.data
-        code, status, j_path, j_schema = ValidateBook(user).validate(title, data)
+        data = request.data
+        # a JSON array or scalar body has no keys to validate
+        if not isinstance(data, dict):
+            return Response({
+                'status_code': 400,
+                'message': constants.format_code("1007")
+            }, status=400)
+        title = data.get('title')
+        code, status, j_path, j_schema = validate_book.validate(user, title, data)
         if code == "1006":
             return Response({
                 'status_code': 422,
-                'message': constants.CODE[code].format(j_path, j_schema)
+                'message': constants.format_code(code, j_path, j_schema)
             })
 
         if not status:
             return Response({
                 'status_code': 200,
-                'message': constants.CODE[code].format(user.username)
+                'message': constants.format_code(code, user.username)
             })
-        super().create(request, *args, **kwargs)
+        serializer = self.get_serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
         return Response({
                 'status_code': 201,
-                'message': constants.CODE[code]
-        })
+                'message': constants.format_code(code)
+        }, status=201)
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
@@ -113,7 +177,7 @@ class UpdateBookView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Book.objects.filter(author=self.request.user, published=True)
+        return BookSerializer.get_list_queryset().filter(author=self.request.user, published=True)
 
 
 class UnPublishedBookDetailsView(generics.ListAPIView):
@@ -125,11 +189,11 @@ class UnPublishedBookDetailsView(generics.ListAPIView):
     List of books : List[Book]
         Returns a list of unpublished books authored by the authenticated user.
     """
-    serializer_class = BookSerializer
+    serializer_class = FastBookSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Book.objects.filter(author=self.request.user, published=False)
+        return BookSerializer.get_list_queryset().filter(author=self.request.user, published=False)
 
 
 class UnpublishedBookView(generics.DestroyAPIView):
@@ -150,13 +214,13 @@ class UnpublishedBookView(generics.DestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Book.objects.filter(author=self.request.user)
+        return BookSerializer.get_list_queryset().filter(author=self.request.user)
 
     def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.unpublish()
-        instance.save()
+        # a single UPDATE scoped to the user's books, no need to load the book first
+        if not Book.objects.filter(pk=kwargs['pk'], author=request.user).unpublish():
+            raise Http404
         return Response({
             'status_code': 200,
-            'message': constants.CODE["1004"]
+            'message': constants.format_code("1004")
         })
@@ -9,7 +9,9 @@ load_dotenv()
 
 def main():
     """Run administrative tasks."""
-    if os.environ.get("DEBUG") == "True":
+    if sys.argv[1:2] == ['test']:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'wookie_books.settings.test')
+    elif os.environ.get("DEBUG") == "True":
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'wookie_books.settings.development')
     else:
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'wookie_books.settings.production')
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Pages through users in primary key order. A cursor keeps every page an index range
+    scan on the primary key, where LIMIT/OFFSET would scan all skipped rows.
+    """
+    page_size = 50
+    ordering = 'id'
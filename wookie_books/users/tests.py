@@ -14,7 +14,8 @@ from .libs import constants
 from .models import CustomUser
 from .serializers import CustomUserSerializer
 
-mock_custom_user_schema = constants.CUSTOM_USER_SCHEMA
+# Built once, jsonschema.validate() re-checks and re-compiles the schema on every call.
+_CUSTOM_USER_VALIDATOR = jsonschema.Draft7Validator(constants.CUSTOM_USER_SCHEMA)
 
 mock_user_1 = {
     "username": "testuser1",
@@ -117,6 +118,22 @@ class CustomUserAPIViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['message'], constants.CODE['106'])
 
+    def test_register_duplicate(self):
+        url = reverse('user_register')
+        # SAVEPOINT, INSERT, ROLLBACK TO and RELEASE SAVEPOINT, plus the author_pseudonym check
+        # when the database reported the username
+        cases = [
+            ({'username': 'testuser3', 'author_pseudonym': 'Test Author 1'}, '104'),
+            ({'username': 'testuser1', 'author_pseudonym': 'Test Author 3'}, '105'),
+            ({'username': 'testuser2', 'author_pseudonym': 'Test Author 1'}, '104'),
+        ]
+        for data, code in cases:
+            with self.subTest(code=code, **data):
+                with self.assertNumQueries(4 if data['author_pseudonym'] == 'Test Author 1' else 5):
+                    response = self.client.post(url, dict(data, password='testpassword3'), format='json')
+                self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+                self.assertEqual(response.data['error'], constants.CODE[code])
+
     def test_login(self):
         url = reverse('user_login')
         data = {
@@ -127,11 +144,21 @@ class CustomUserAPIViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('token', response.data)
 
+        # the returned token authenticates API requests
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['token']}")
+        response = self.client.get(reverse('list_users'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_user_list_create_authenticated(self):
         refresh = RefreshToken.for_user(self.user1)
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
         response = self.client.get(reverse('list_users'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user['username'] for user in response.data['results']],
+            [self.user1.username, self.user2.username]
+        )
+        self.assertIsNone(response.data['next'])
 
     def test_user_list_create_unauthenticated(self):
         response = self.client.get(reverse('list_users'))
@@ -196,19 +223,19 @@ class CustomUserSchemaValidationTestCase(TestCase):
 
         # Validate the dictionary against the schema
         try:
-            jsonschema.validate(user_dict, mock_custom_user_schema)
+            _CUSTOM_USER_VALIDATOR.validate(user_dict)
         except jsonschema.exceptions.ValidationError as e:
             self.fail(e)
 
     def test_custom_user_invalid_schema(self):
         invalid_author_pseudonym = {'author_pseudonym': 1}
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(invalid_author_pseudonym, mock_custom_user_schema)
+            _CUSTOM_USER_VALIDATOR.validate(invalid_author_pseudonym)
 
         invalid_created_on = {'created_on': "2023-03-26"}
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(invalid_created_on, mock_custom_user_schema)
+            _CUSTOM_USER_VALIDATOR.validate(invalid_created_on)
 
         invalid_updated_on = {'updated_on': 1}
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(invalid_updated_on, mock_custom_user_schema)
+            _CUSTOM_USER_VALIDATOR.validate(invalid_updated_on)
@@ -1,14 +1,35 @@
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
 from rest_framework import generics, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
 
 from .libs import constants
 from .models import CustomUser
+from .pagination import UserCursorPagination
 from .serializers import CustomUserSerializer
 
 
+def _duplicate_field(error):
+    """
+    Returns 'username' or 'author_pseudonym' when the IntegrityError is a violation of that
+    field's unique constraint on CustomUser, otherwise None.
+    """
+    table = CustomUser._meta.db_table
+    cause = error.__cause__
+    diag = getattr(cause, 'diag', None)
+    for field in ('author_pseudonym', 'username'):
+        if diag is not None:
+            # PostgreSQL names inline UNIQUE constraints <table>_<column>_key
+            if diag.constraint_name == f'{table}_{field}_key':
+                return field
+        elif str(cause) == f'UNIQUE constraint failed: {table}.{field}':
+            # SQLite has no constraint names, it reports the column
+            return field
+    return None
+
+
 class RegisterView(APIView):
     """
     RegisterView is a Django REST framework APIView that handles user registration.
@@ -24,8 +45,8 @@ class RegisterView(APIView):
                                           registration is successful, or an error message
                                           with a corresponding error code if the registration fails.
 
-    The view checks for the presence of the required fields and validates that the
-    username and author_pseudonym are unique. If the input data is valid, a new
+    The view checks for the presence of the required fields and relies on the unique
+    constraints of username and author_pseudonym to reject duplicates. If the input data is valid, a new
     CustomUser instance is created, and a success message is returned.
 
     If the input data is not valid or if the username or author_pseudonym already
@@ -44,17 +65,20 @@ class RegisterView(APIView):
         if not author_pseudonym:
             return Response({'error': constants.CODE.get('103')}, status=400)
 
-        # Check if author_pseudonym already exists
-        if CustomUser.objects.filter(author_pseudonym=author_pseudonym).exists():
-            return Response({'error': constants.CODE.get('104')}, status=409)
-
-        # Check if username already exists
-        if CustomUser.objects.filter(username=username).exists():
+        # Create new user, the unique constraints on author_pseudonym and username reject duplicates
+        # in the same INSERT, without a check-then-insert race
+        try:
+            with transaction.atomic():
+                CustomUser.objects.create_user(username, password=password, author_pseudonym=author_pseudonym)
+        except IntegrityError as e:
+            field = _duplicate_field(e)
+            if field is None:
+                raise
+            # the database reports a single violated constraint, a taken author_pseudonym takes precedence
+            if field == 'author_pseudonym' or CustomUser.objects.filter(author_pseudonym=author_pseudonym).exists():
+                return Response({'error': constants.CODE.get('104')}, status=409)
             return Response({'error': constants.CODE.get('105')}, status=409)
 
-        # Create new user
-        CustomUser.objects.create_user(username, password=password, author_pseudonym=author_pseudonym)
-
         return Response({'message': constants.CODE.get('106')}, status=200)
 
 
@@ -89,9 +113,8 @@ class LoginView(APIView):
         if not user:
             return Response({'error': constants.CODE.get('107')}, status=401)
 
-        # Generate JWT token
-        refresh = RefreshToken.for_user(user)
-        access_token = str(refresh.access_token)
+        # Generate JWT token, only the access token is returned so don't build a refresh token
+        access_token = str(AccessToken.for_user(user))
 
         return Response({'token': access_token})
 
@@ -117,10 +140,12 @@ class UserListCreateView(generics.ListCreateAPIView):
     requires the user to be authenticated in order to access the list and create
     new users.
 
-    When accessed with a GET request, the view returns a list of CustomUser
-    instances. When accessed with a POST request, the view creates a new CustomUser
-    instance based on the provided input data.
+    When accessed with a GET request, the view returns a cursor-paginated list of
+    CustomUser instances, loading only the serialized columns. When accessed with a
+    POST request, the view creates a new CustomUser instance based on the provided
+    input data.
     """
-    queryset = CustomUser.objects.all()
+    queryset = CustomUser.objects.only('id', 'username', 'author_pseudonym')
     serializer_class = CustomUserSerializer
+    pagination_class = UserCursorPagination
     permission_classes = [permissions.IsAuthenticated]
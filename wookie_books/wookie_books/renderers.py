@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson handles dicts, lists, strings and numbers natively, DRF's encoder covers the rest
+# (Decimal, lazy translation strings, querysets, ...)
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renders responses as compact JSON with orjson, a drop-in for DRF's JSONRenderer.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        try:
+            # non-str keys appear in DRF's ListField and DictField validation errors
+            return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson only encodes 64-bit integers, the stock renderer handles the rest
+            return JSONRenderer().render(data, accepted_media_type, renderer_context)
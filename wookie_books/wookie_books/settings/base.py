@@ -114,4 +114,5 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),  # Lifetime of the access token (e.g., 60 minutes)
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),  # Lifetime of the refresh token (e.g., 1 day)
+    'ALGORITHM': 'HS256',  # HMAC signing with SIGNING_KEY, much cheaper than RSA
 }
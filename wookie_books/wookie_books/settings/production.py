@@ -26,5 +26,45 @@ DATABASES = {
         "PASSWORD": DB_PASSWORD,
         "HOST": DB_HOST,
         "PORT": DB_PORT,
+        # reuse connections across requests instead of reconnecting every time
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
+        # required when POSTGRES_HOST points at PgBouncer in transaction pooling mode
+        "DISABLE_SERVER_SIDE_CURSORS": os.environ.get("DB_DISABLE_SERVER_SIDE_CURSORS") == "True",
+    }
+}
+
+# orjson for JSON bodies; form and multipart parsers stay for book uploads
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_RENDERER_CLASSES": [
+        "wookie_books.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "wookie_books.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# HS256 tokens are signed with a plain shared secret, there is no key material to parse per login.
+# A dedicated JWT_SIGNING_KEY lets tokens be rotated without touching DJANGO_SECRET_KEY.
+SIMPLE_JWT = {
+    **SIMPLE_JWT,
+    "SIGNING_KEY": os.environ.get("JWT_SIGNING_KEY", SECRET_KEY),
+}
+
+# Argon2 for new and upgraded hashes; PBKDF2 stays listed so existing users can still
+# log in, and their hash is upgraded to Argon2 once on their next login.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+]
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
     }
 }
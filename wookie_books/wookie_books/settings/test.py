@@ -0,0 +1,29 @@
+import atexit
+import shutil
+import tempfile
+
+from .development import *
+
+# Password hashing dominates user creation in the test suite, use a fast hasher there.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Keep uploaded covers out of the project directory, and remove them when the run ends.
+MEDIA_ROOT = tempfile.mkdtemp(prefix='wookie_books_media_')
+atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+
+# Run the suite against an in-memory database, whatever the development settings use.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Tests that exercise response caching turn it on with override_settings.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
@@ -0,0 +1,61 @@
+import json
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """
+    ORJSONRendererTestCase checks that ORJSONRenderer renders what DRF's JSONRenderer does.
+
+    Test cases:
+        - test_render: Checks strings, numbers, Decimals and nested data against JSONRenderer.
+        - test_render_none: Checks that an empty body is rendered for None.
+        - test_render_non_str_keys: Checks that int keys, as in ListField errors, are rendered as strings.
+        - test_render_big_int: Checks that integers beyond 64 bits fall back to JSONRenderer.
+    """
+
+    def setUp(self):
+        self.renderer = ORJSONRenderer()
+
+    def test_render(self):
+        data = {'title': 'Éclair', 'price': Decimal('9.99'), 'tags': [1, 2.5, None, True]}
+        self.assertEqual(json.loads(self.renderer.render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_render_none(self):
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_render_non_str_keys(self):
+        data = {'tags': {0: ['Not a valid string.']}}
+        self.assertEqual(json.loads(self.renderer.render(data)), {'tags': {'0': ['Not a valid string.']}})
+
+    def test_render_big_int(self):
+        data = {'count': 2 ** 64, 'offset': -2 ** 70}
+        self.assertEqual(self.renderer.render(data), JSONRenderer().render(data))
+
+
+class ORJSONParserTestCase(SimpleTestCase):
+    """
+    ORJSONParserTestCase checks that ORJSONParser parses request bodies like DRF's JSONParser.
+
+    Test cases:
+        - test_parse: Checks that a JSON body is parsed.
+        - test_parse_invalid: Checks that a malformed body raises ParseError.
+    """
+
+    def setUp(self):
+        self.parser = ORJSONParser()
+
+    def test_parse(self):
+        body = '{"title": "Éclair", "price": "9.99", "tags": [1, null]}'.encode()
+        self.assertEqual(self.parser.parse(BytesIO(body)), {'title': 'Éclair', 'price': '9.99', 'tags': [1, None]})
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ParseError):
+            self.parser.parse(BytesIO(b'{"title": '))